@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from benchmarks.inputs import LINEAR_PROBES, ORDERS, PROBES, SIZES, make_keys
+
+
+# Input Fixtures
+# ------------
+@pytest.fixture(params=SIZES, ids=lambda size: f"n={size}")
+def size(request):
+    return request.param
+
+
+@pytest.fixture(params=ORDERS)
+def keys(request, size):
+    return make_keys(size, request.param)
+
+
+@pytest.fixture
+def other_keys(keys):
+    """Keys disjoint from `keys` with the same ordering pattern, for merges"""
+    offset = 2 * max(keys)
+    return [key + offset for key in keys]
+
+
+@pytest.fixture
+def probes(keys):
+    return random.Random(0).sample(keys, min(PROBES, len(keys)))
+
+
+@pytest.fixture
+def linear_probes(probes):
+    return probes[:LINEAR_PROBES]
+
+
+@pytest.fixture
+def fresh_keys(other_keys):
+    """Keys not yet in the structure, for insert benchmarks"""
+    return other_keys[:PROBES]
@@ -0,0 +1,24 @@
+import random
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+ORDERS = ["sorted", "random", "adversarial"]
+
+PROBES = 1_000  # keys looked up/inserted/deleted per round for sublinear ops
+LINEAR_PROBES = 10  # the same, for structures where each probe is O(n)
+ROUNDS = 5  # rounds for benchmarks that need a fresh structure per round
+
+
+def make_keys(size, order):
+    """
+    Distinct integer keys in the requested order.
+    "adversarial" keys arrive in descending order (worst case for min-heap
+    sift-up and unbalanced trees) and share their low 20 bits (worst case
+    for hash tables that index by masking the hash).
+    """
+    if order == "sorted":
+        return list(range(size))
+    if order == "random":
+        keys = list(range(size))
+        random.Random(size).shuffle(keys)
+        return keys
+    return [(size - i) << 20 for i in range(size)]
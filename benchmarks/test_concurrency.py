@@ -0,0 +1,81 @@
+import queue
+import sys
+import threading
+
+import pytest
+from nebula.data_structures import BlockingHeap, ConcurrentHashMap
+
+THREADS = [1, 2, 4, 8]
+OPERATIONS = 100_000  # total per round, split evenly across threads
+
+
+class LockedDict:
+    """Baseline: a plain dict behind one global lock"""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+
+
+MAPS = {"nebula": lambda: ConcurrentHashMap(segments=16), "locked-dict": LockedDict}
+QUEUES = {"nebula": BlockingHeap, "priority-queue": queue.PriorityQueue}
+
+
+def run_threads(worker, count):
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.fixture(params=THREADS, ids=lambda count: f"threads={count}")
+def threads(request, benchmark):
+    # sys._is_gil_enabled only exists on 3.13+; older builds always hold the GIL
+    benchmark.extra_info["gil"] = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return request.param
+
+
+@pytest.mark.benchmark(group="concurrent-map")
+@pytest.mark.parametrize("make_map", MAPS.values(), ids=MAPS.keys())
+def test_map_contention(benchmark, make_map, threads):
+    per_thread = OPERATIONS // threads
+
+    def mixed_workload():
+        hmap = make_map()
+
+        def worker(n):
+            base = n * per_thread
+            for i in range(base, base + per_thread):
+                hmap[i] = i
+                hmap[i]
+
+        run_threads(worker, threads)
+
+    benchmark(mixed_workload)
+
+
+@pytest.mark.benchmark(group="concurrent-queue")
+@pytest.mark.parametrize("make_queue", QUEUES.values(), ids=QUEUES.keys())
+def test_queue_contention(benchmark, make_queue, threads):
+    per_thread = OPERATIONS // threads
+
+    def producer_consumer():
+        work = make_queue()
+
+        def worker(n):
+            for i in range(per_thread):
+                work.put(i)
+                work.get(timeout=5)
+
+        run_threads(worker, threads)
+
+    benchmark(producer_consumer)
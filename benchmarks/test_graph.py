@@ -0,0 +1,111 @@
+import operator
+from types import SimpleNamespace
+
+import pytest
+from nebula.data_structures import Graph
+
+from benchmarks.inputs import ROUNDS
+
+
+def adjacency_from_edges(edges):
+    adjacency = {}
+    for source, target in edges:
+        adjacency.setdefault(source, []).append(target)
+        adjacency.setdefault(target, [])
+    return adjacency
+
+
+def adjacency_add_edge(adjacency, source, target):
+    adjacency.setdefault(source, []).append(target)
+    adjacency.setdefault(target, [])
+
+
+def adjacency_remove_edge(adjacency, source, target):
+    adjacency[source].remove(target)
+
+
+def adjacency_edges(adjacency):
+    return ((source, target) for source in adjacency for target in adjacency[source])
+
+
+def adjacency_merge(left, right):
+    merged = {vertex: list(targets) for vertex, targets in left.items()}
+    for vertex, targets in right.items():
+        merged.setdefault(vertex, []).extend(targets)
+    return merged
+
+
+IMPLEMENTATIONS = {
+    "nebula": SimpleNamespace(
+        build=Graph.from_edges,
+        add_edge=Graph.add_edge,
+        remove_edge=Graph.remove_edge,
+        edges=Graph.edges,
+        merge=operator.add,
+    ),
+    "dict": SimpleNamespace(
+        build=adjacency_from_edges,
+        add_edge=adjacency_add_edge,
+        remove_edge=adjacency_remove_edge,
+        edges=adjacency_edges,
+        merge=adjacency_merge,
+    ),
+}
+
+
+@pytest.fixture(params=IMPLEMENTATIONS)
+def impl(request):
+    return IMPLEMENTATIONS[request.param]
+
+
+@pytest.fixture
+def edges(keys):
+    """A path through the keys in input order"""
+    return list(zip(keys, keys[1:]))
+
+
+@pytest.mark.benchmark(group="graph-build")
+def test_build(benchmark, impl, keys, edges):
+    assert len(benchmark(impl.build, edges)) == len(keys)
+
+
+@pytest.mark.benchmark(group="graph-insert")
+def test_add_edge(benchmark, impl, edges, keys, fresh_keys):
+    def add_all(graph):
+        for source, target in zip(keys, fresh_keys):
+            impl.add_edge(graph, source, target)
+
+    benchmark.pedantic(add_all, setup=lambda: ((impl.build(edges),), {}), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="graph-lookup")
+def test_neighbours(benchmark, impl, edges, probes):
+    graph = impl.build(edges)
+    benchmark(lambda: sum(len(graph[vertex]) for vertex in probes))
+
+
+@pytest.mark.benchmark(group="graph-delete")
+def test_remove_edge(benchmark, impl, edges):
+    removed = edges[:: max(1, len(edges) // 1_000)]
+
+    def remove_all(graph):
+        for source, target in removed:
+            impl.remove_edge(graph, source, target)
+
+    benchmark.pedantic(
+        remove_all, setup=lambda: ((impl.build(edges),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="graph-iterate")
+def test_edges(benchmark, impl, edges):
+    graph = impl.build(edges)
+    assert benchmark(lambda: sum(1 for _ in impl.edges(graph))) == len(edges)
+
+
+@pytest.mark.benchmark(group="graph-merge")
+def test_add(benchmark, impl, edges, other_keys):
+    left = impl.build(edges)
+    right = impl.build(zip(other_keys, other_keys[1:]))
+    merged = benchmark(impl.merge, left, right)
+    assert len(merged) == 2 * len(left)
@@ -0,0 +1,73 @@
+import operator
+from types import SimpleNamespace
+
+import pytest
+from nebula.data_structures import HashMap
+
+from benchmarks.inputs import ROUNDS
+
+IMPLEMENTATIONS = {
+    "nebula": SimpleNamespace(build=HashMap.from_dict, merge=operator.add),
+    "dict": SimpleNamespace(build=dict, merge=operator.or_),
+}
+
+
+@pytest.fixture(params=IMPLEMENTATIONS)
+def impl(request):
+    return IMPLEMENTATIONS[request.param]
+
+
+@pytest.fixture
+def mapping(keys):
+    return dict.fromkeys(keys, 0)
+
+
+@pytest.mark.benchmark(group="hashmap-build")
+def test_build(benchmark, impl, mapping):
+    assert len(benchmark(impl.build, mapping)) == len(mapping)
+
+
+@pytest.mark.benchmark(group="hashmap-insert")
+def test_setitem(benchmark, impl, mapping, fresh_keys):
+    def insert_all(hmap):
+        for key in fresh_keys:
+            hmap[key] = 0
+
+    benchmark.pedantic(
+        insert_all, setup=lambda: ((impl.build(mapping),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="hashmap-lookup")
+def test_getitem(benchmark, impl, mapping, probes):
+    hmap = impl.build(mapping)
+
+    def lookup_all():
+        for key in probes:
+            hmap[key]
+
+    benchmark(lookup_all)
+
+
+@pytest.mark.benchmark(group="hashmap-delete")
+def test_delitem(benchmark, impl, mapping, probes):
+    def delete_all(hmap):
+        for key in probes:
+            del hmap[key]
+
+    benchmark.pedantic(
+        delete_all, setup=lambda: ((impl.build(mapping),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="hashmap-iterate")
+def test_iterate(benchmark, impl, mapping):
+    hmap = impl.build(mapping)
+    assert benchmark(lambda: sum(1 for _ in hmap.items())) == len(mapping)
+
+
+@pytest.mark.benchmark(group="hashmap-merge")
+def test_add(benchmark, impl, mapping, other_keys):
+    left, right = impl.build(mapping), impl.build(dict.fromkeys(other_keys, 0))
+    merged = benchmark(impl.merge, left, right)
+    assert len(merged) == len(mapping) + len(other_keys)
@@ -0,0 +1,80 @@
+import heapq
+import operator
+from types import SimpleNamespace
+
+import pytest
+from nebula.data_structures import Heap
+
+from benchmarks.inputs import ROUNDS
+
+
+def heapified(iterable):
+    heap = list(iterable)
+    heapq.heapify(heap)
+    return heap
+
+
+IMPLEMENTATIONS = {
+    "nebula": SimpleNamespace(
+        build=Heap.from_iterable,
+        push=Heap.push,
+        pop=Heap.pop,
+        drain=list,
+        merge=operator.add,
+    ),
+    "heapq": SimpleNamespace(
+        build=heapified,
+        push=heapq.heappush,
+        pop=heapq.heappop,
+        drain=sorted,
+        merge=lambda left, right: heapified(left + right),
+    ),
+}
+
+
+@pytest.fixture(params=IMPLEMENTATIONS)
+def impl(request):
+    return IMPLEMENTATIONS[request.param]
+
+
+@pytest.mark.benchmark(group="heap-build")
+def test_build(benchmark, impl, keys):
+    assert len(benchmark(impl.build, keys)) == len(keys)
+
+
+@pytest.mark.benchmark(group="heap-insert")
+def test_push(benchmark, impl, keys, fresh_keys):
+    def push_all(heap):
+        for key in fresh_keys:
+            impl.push(heap, key)
+
+    benchmark.pedantic(push_all, setup=lambda: ((impl.build(keys),), {}), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="heap-lookup")
+def test_contains(benchmark, impl, keys, linear_probes):
+    heap = impl.build(keys)
+    found = benchmark(lambda: sum(key in heap for key in linear_probes))
+    assert found == len(linear_probes)
+
+
+@pytest.mark.benchmark(group="heap-delete")
+def test_pop(benchmark, impl, keys, probes):
+    def pop_all(heap):
+        for _ in probes:
+            impl.pop(heap)
+
+    benchmark.pedantic(pop_all, setup=lambda: ((impl.build(keys),), {}), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="heap-iterate")
+def test_sorted_iteration(benchmark, impl, keys):
+    heap = impl.build(keys)
+    assert benchmark(impl.drain, heap) == sorted(keys)
+
+
+@pytest.mark.benchmark(group="heap-merge")
+def test_add(benchmark, impl, keys, other_keys):
+    left, right = impl.build(keys), impl.build(other_keys)
+    merged = benchmark(impl.merge, left, right)
+    assert len(merged) == len(keys) + len(other_keys)
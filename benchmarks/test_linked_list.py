@@ -0,0 +1,68 @@
+import operator
+from types import SimpleNamespace
+
+import pytest
+from nebula.data_structures import LinkedList
+
+from benchmarks.inputs import ROUNDS
+
+IMPLEMENTATIONS = {
+    "nebula": SimpleNamespace(
+        build=LinkedList.from_iterable,
+        append=LinkedList.append,
+        delete=LinkedList.delete,
+    ),
+    "list": SimpleNamespace(build=list, append=list.append, delete=list.remove),
+}
+
+
+@pytest.fixture(params=IMPLEMENTATIONS)
+def impl(request):
+    return IMPLEMENTATIONS[request.param]
+
+
+@pytest.mark.benchmark(group="linked_list-build")
+def test_build(benchmark, impl, keys):
+    assert len(benchmark(impl.build, keys)) == len(keys)
+
+
+@pytest.mark.benchmark(group="linked_list-insert")
+def test_append(benchmark, impl, keys, fresh_keys):
+    def append_all(container):
+        for key in fresh_keys:
+            impl.append(container, key)
+
+    benchmark.pedantic(
+        append_all, setup=lambda: ((impl.build(keys),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="linked_list-lookup")
+def test_contains(benchmark, impl, keys, linear_probes):
+    container = impl.build(keys)
+    found = benchmark(lambda: sum(key in container for key in linear_probes))
+    assert found == len(linear_probes)
+
+
+@pytest.mark.benchmark(group="linked_list-delete")
+def test_delete(benchmark, impl, keys, linear_probes):
+    def delete_all(container):
+        for key in linear_probes:
+            impl.delete(container, key)
+
+    benchmark.pedantic(
+        delete_all, setup=lambda: ((impl.build(keys),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="linked_list-iterate")
+def test_iterate(benchmark, impl, keys):
+    container = impl.build(keys)
+    assert benchmark(lambda: sum(1 for _ in container)) == len(keys)
+
+
+@pytest.mark.benchmark(group="linked_list-merge")
+def test_add(benchmark, impl, keys, other_keys):
+    left, right = impl.build(keys), impl.build(other_keys)
+    merged = benchmark(operator.add, left, right)
+    assert len(merged) == len(keys) + len(other_keys)
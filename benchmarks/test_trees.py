@@ -0,0 +1,181 @@
+import bisect
+import functools
+import operator
+from types import SimpleNamespace
+
+import pytest
+from nebula.data_structures import BinarySearchTree, BinaryTree
+
+from benchmarks.inputs import ROUNDS
+
+
+def sorted_contains(keys, key):
+    i = bisect.bisect_left(keys, key)
+    return i < len(keys) and keys[i] == key
+
+
+def sorted_delete(keys, key):
+    del keys[bisect.bisect_left(keys, key)]
+
+
+BST_IMPLEMENTATIONS = {
+    "nebula": SimpleNamespace(
+        build=BinarySearchTree.from_iterable,
+        insert=BinarySearchTree.insert,
+        contains=operator.contains,
+        delete=BinarySearchTree.delete,
+        iterate=BinarySearchTree.inorder,
+        merge=operator.add,
+    ),
+    "nebula-blocks": SimpleNamespace(
+        build=functools.partial(BinarySearchTree.from_iterable, backend="blocks"),
+        insert=BinarySearchTree.insert,
+        contains=operator.contains,
+        delete=BinarySearchTree.delete,
+        iterate=BinarySearchTree.inorder,
+        merge=operator.add,
+    ),
+    "bisect": SimpleNamespace(
+        build=sorted,
+        insert=bisect.insort,
+        contains=sorted_contains,
+        delete=sorted_delete,
+        iterate=iter,
+        merge=lambda left, right: sorted(left + right),
+    ),
+}
+
+
+def level_order_tree(keys, storage=None):
+    """
+    Build through BinaryTree.insert, the level-order path. from_iterable keeps
+    the input as preorder instead, which chains sorted input into one branch
+    """
+    tree = BinaryTree() if storage is None else BinaryTree(storage=storage)
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+# Each node-storage insert is a BFS for the first free slot, so the large sizes
+# are left to "nebula-array"
+NODE_STORAGE_MAX_SIZE = 10_000
+
+# insert() fills a complete tree level by level, so a list appended in order
+# holds the same values in the same level order
+BINARY_TREE_IMPLEMENTATIONS = {
+    "nebula": SimpleNamespace(
+        build=level_order_tree,
+        insert=BinaryTree.insert,
+        iterate=BinaryTree.level_order,
+        merge=operator.add,
+    ),
+    "nebula-array": SimpleNamespace(
+        build=functools.partial(level_order_tree, storage="array"),
+        insert=BinaryTree.insert,
+        iterate=BinaryTree.level_order,
+        merge=operator.add,
+    ),
+    "list": SimpleNamespace(
+        build=list, insert=list.append, iterate=iter, merge=operator.add
+    ),
+}
+
+
+@pytest.fixture(params=BST_IMPLEMENTATIONS)
+def bst(request):
+    return BST_IMPLEMENTATIONS[request.param]
+
+
+@pytest.fixture(params=BINARY_TREE_IMPLEMENTATIONS)
+def binary_tree(request, size):
+    if request.param == "nebula" and size > NODE_STORAGE_MAX_SIZE:
+        pytest.skip("node-storage level-order insert is quadratic at this size")
+    return BINARY_TREE_IMPLEMENTATIONS[request.param]
+
+
+# Binary Search Tree Benchmarks
+# ---------------------------
+@pytest.mark.benchmark(group="bst-build")
+def test_bst_build(benchmark, bst, keys):
+    assert len(benchmark(bst.build, keys)) == len(keys)
+
+
+@pytest.mark.benchmark(group="bst-insert")
+def test_bst_insert(benchmark, bst, keys, fresh_keys):
+    def insert_all(tree):
+        for key in fresh_keys:
+            bst.insert(tree, key)
+
+    benchmark.pedantic(
+        insert_all, setup=lambda: ((bst.build(keys),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="bst-lookup")
+def test_bst_contains(benchmark, bst, keys, probes):
+    tree = bst.build(keys)
+    found = benchmark(lambda: sum(bst.contains(tree, key) for key in probes))
+    assert found == len(probes)
+
+
+@pytest.mark.benchmark(group="bst-delete")
+def test_bst_delete(benchmark, bst, keys, probes):
+    def delete_all(tree):
+        for key in probes:
+            bst.delete(tree, key)
+
+    benchmark.pedantic(
+        delete_all, setup=lambda: ((bst.build(keys),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="bst-iterate")
+def test_bst_inorder(benchmark, bst, keys):
+    tree = bst.build(keys)
+    assert benchmark(lambda: sum(1 for _ in bst.iterate(tree))) == len(keys)
+
+
+@pytest.mark.benchmark(group="bst-merge")
+def test_bst_add(benchmark, bst, keys, other_keys):
+    left, right = bst.build(keys), bst.build(other_keys)
+    merged = benchmark(bst.merge, left, right)
+    assert len(merged) == len(keys) + len(other_keys)
+
+
+# Binary Tree Benchmarks
+# --------------------
+@pytest.mark.benchmark(group="binary_tree-build")
+def test_binary_tree_build(benchmark, binary_tree, keys):
+    assert len(benchmark(binary_tree.build, keys)) == len(keys)
+
+
+@pytest.mark.benchmark(group="binary_tree-insert")
+def test_binary_tree_insert(benchmark, binary_tree, keys, fresh_keys):
+    def insert_all(tree):
+        for key in fresh_keys:
+            binary_tree.insert(tree, key)
+
+    benchmark.pedantic(
+        insert_all, setup=lambda: ((binary_tree.build(keys),), {}), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="binary_tree-lookup")
+def test_binary_tree_contains(benchmark, binary_tree, keys, linear_probes):
+    tree = binary_tree.build(keys)
+    found = benchmark(lambda: sum(key in tree for key in linear_probes))
+    assert found == len(linear_probes)
+
+
+@pytest.mark.benchmark(group="binary_tree-iterate")
+def test_binary_tree_level_order(benchmark, binary_tree, keys):
+    tree = binary_tree.build(keys)
+    assert benchmark(lambda: sum(1 for _ in binary_tree.iterate(tree))) == len(keys)
+
+
+@pytest.mark.benchmark(group="binary_tree-merge")
+def test_binary_tree_add(benchmark, binary_tree, keys, other_keys):
+    left, right = binary_tree.build(keys), binary_tree.build(other_keys)
+    merged = benchmark(binary_tree.merge, left, right)
+    assert len(merged) == len(keys) + len(other_keys)
@@ -82,3 +82,17 @@ def complete_binary_tree():
     for i in range(1, 8):
         tree.insert(i)
     return tree
+
+
+# Storage Mode Fixtures
+# -------------------
+@pytest.fixture
+def array_binary_tree():
+    """
+    Complete binary tree using the implicit-array storage mode,
+    where node i's children live at 2i+1 and 2i+2
+    """
+    tree = BinaryTree(storage="array")
+    for i in range(1, 8):
+        tree.insert(i)
+    return tree
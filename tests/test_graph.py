@@ -1,5 +1,9 @@
+import sys
+from array import array
+from types import GeneratorType
+
 import pytest
-from nebula.data_structures import Graph
+from nebula.data_structures import BinarySearchTree, Graph
 
 
 # Basic Tests
@@ -58,3 +62,278 @@ def test_graph_large_scale(benchmark):
 
     # Benchmark the creation of a large graph
     benchmark(create_large_graph)
+
+
+# Frozen Snapshot Tests
+def test_graph_freeze_queries():
+    graph = Graph.from_edges([("A", "B"), ("A", "C"), ("B", "C"), ("C", "D")])
+    frozen = graph.freeze()
+
+    assert len(frozen) == 4
+    assert list(frozen) == ["A", "B", "C", "D"]  # vertex order is preserved
+    assert list(frozen["A"]) == ["B", "C"]
+    assert frozen.degree("A") == 2
+    assert frozen.degree("D") == 0
+    assert list(frozen.bfs("A")) == ["A", "B", "C", "D"]
+    assert list(frozen.dfs("A")) == ["A", "B", "C", "D"]
+
+
+def test_graph_freeze_is_immutable_snapshot():
+    graph = Graph.from_edges([("A", "B")])
+    frozen = graph.freeze()
+    graph.add_edge("B", "C")  # later mutation does not leak into the snapshot
+
+    assert "C" not in frozen
+    with pytest.raises(TypeError):
+        frozen["D"] = ["A"]
+    assert not hasattr(frozen, "add_edge")
+
+
+def test_graph_freeze_round_trip():
+    graph = Graph.from_edges([("A", "B"), ("B", "C"), ("C", "A")])
+    graph.add_vertex("E")
+    thawed = graph.freeze().thaw()
+
+    assert isinstance(thawed, Graph)
+    assert thawed == graph
+    thawed.add_edge("E", "A")  # the result is mutable again
+    assert "A" in thawed["E"]
+
+
+@pytest.mark.benchmark
+def test_frozen_graph_traversal_performance(benchmark):
+    edges = [(i, i + 1) for i in range(9_999)]
+    edges += [(i, i * 7 % 10_000) for i in range(10_000)]
+    frozen = Graph.from_edges(edges).freeze()
+
+    visited = benchmark(lambda: sum(1 for _ in frozen.bfs(0)))
+    assert visited == 10_000
+
+
+# Algorithm Tests
+def test_graph_bfs_dfs():
+    graph = Graph.from_edges([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")])
+    assert isinstance(graph.bfs("A"), GeneratorType)
+    assert list(graph.bfs("A")) == ["A", "B", "C", "D"]
+    assert list(graph.dfs("A")) == ["A", "B", "D", "C"]
+    assert list(graph.bfs("D")) == ["D"]
+
+
+def test_graph_traversal_on_deep_chain():
+    depth = sys.getrecursionlimit() * 2
+    graph = Graph.from_edges((i, i + 1) for i in range(depth))
+    assert sum(1 for _ in graph.dfs(0)) == depth + 1
+
+
+def test_graph_topological_sort():
+    graph = Graph.from_edges([("shirt", "tie"), ("tie", "jacket"), ("pants", "shoes")])
+    order = list(graph.topological_sort())
+    assert order.index("shirt") < order.index("tie") < order.index("jacket")
+    assert order.index("pants") < order.index("shoes")
+    assert len(order) == len(graph)
+
+    graph.add_edge("jacket", "shirt")
+    with pytest.raises(ValueError):
+        list(graph.topological_sort())  # cycles have no topological order
+
+
+def test_graph_connected_components():
+    graph = Graph.from_edges([("A", "B"), ("C", "B"), ("D", "E")])
+    graph.add_vertex("F")
+    components = sorted(sorted(c) for c in graph.connected_components())
+    assert components == [["A", "B", "C"], ["D", "E"], ["F"]]
+
+
+def test_graph_shortest_path():
+    graph = Graph()
+    graph.add_edge("A", "B", weight=1)
+    graph.add_edge("B", "D", weight=5)
+    graph.add_edge("A", "C", weight=2)
+    graph.add_edge("C", "D", weight=1)
+
+    assert graph.shortest_path("A", "D", weighted=True) == ["A", "C", "D"]
+    assert len(graph.shortest_path("A", "D")) == 3  # bidirectional BFS, hop count
+    assert graph.shortest_path("A", "A") == ["A"]
+    assert graph.shortest_path("D", "A") is None  # unreachable
+
+
+@pytest.mark.benchmark
+def test_graph_shortest_path_performance(benchmark):
+    graph = Graph.from_edges((i, i + 1) for i in range(10_000))
+    path = benchmark(graph.shortest_path, 0, 10_000)
+    assert len(path) == 10_001
+
+
+# Adjacency Backend Tests
+def test_graph_has_edge_and_dedup():
+    graph = Graph.from_edges([("A", "B"), ("A", "C"), ("A", "B")])
+    assert graph.has_edge("A", "B")
+    assert not graph.has_edge("B", "A")  # edges are directed
+    assert not graph.has_edge("Z", "A")
+    assert graph["A"] == ["B", "C"]  # duplicate edge ignored, order kept
+
+
+def test_graph_remove_edge_and_vertex():
+    graph = Graph.from_edges([("A", "B"), ("A", "C"), ("C", "B"), ("B", "D")])
+    graph.remove_edge("A", "B")
+    assert graph["A"] == ["C"]
+    with pytest.raises(KeyError):
+        graph.remove_edge("A", "B")
+
+    graph.remove_vertex("B")  # also drops every edge into B
+    assert "B" not in graph
+    assert graph["C"] == []
+    assert list(graph.edges()) == [("A", "C")]
+
+
+def test_graph_neighbour_view_is_live():
+    graph = Graph.from_edges([("A", "B")])
+    neighbours = graph["A"]
+    graph.add_edge("A", "C")
+
+    assert neighbours == ["B", "C"]  # a view, not a copy
+    assert len(neighbours) == 2
+    assert neighbours[-1] == "C"
+    assert "C" in neighbours
+
+
+@pytest.mark.benchmark
+def test_graph_hub_vertex_performance(benchmark):
+    def build_hub():
+        graph = Graph()
+        for i in range(100_000):
+            graph.add_edge("hub", i)
+        return graph
+
+    graph = benchmark(build_hub)
+    assert graph.has_edge("hub", 99_999)
+
+
+# Bulk Ingestion Tests
+def test_graph_add_edges():
+    graph = Graph.from_edges([("A", "B")])
+    graph.add_edges(iter([("B", "C"), ("A", "C"), ("A", "B")]))  # any iterable
+    assert list(graph) == ["A", "B", "C"]
+    assert list(graph.edges()) == [("A", "B"), ("A", "C"), ("B", "C")]
+
+
+def test_graph_load_text_edgelist(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("# source target\nA B\nB C\n\nA C\n")
+
+    graph = Graph.load_edgelist(path)
+    assert graph == Graph.from_edges([("A", "B"), ("B", "C"), ("A", "C")])
+
+    numeric = tmp_path / "numeric.txt"
+    numeric.write_text("1 2\n2 3\n")
+    assert list(Graph.load_edgelist(numeric, nodetype=int).edges()) == [(1, 2), (2, 3)]
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_graph_load_binary_edgelist(tmp_path, use_mmap):
+    path = tmp_path / "edges.bin"
+    path.write_bytes(array("q", [0, 1, 1, 2, 2, 0]).tobytes())  # int64 pairs
+
+    graph = Graph.load_edgelist(path, binary=True, mmap=use_mmap, chunk_size=2)
+    assert list(graph.edges()) == [(0, 1), (1, 2), (2, 0)]
+
+
+@pytest.mark.benchmark
+def test_graph_bulk_ingestion_performance(benchmark):
+    edges = [(i, i + 1) for i in range(100_000)]
+    graph = benchmark(Graph.from_edges, edges)
+    assert len(graph) == 100_001
+
+
+# Parallel Analytics Tests
+def test_graph_pagerank():
+    cycle = Graph.from_edges([("A", "B"), ("B", "C"), ("C", "A")])
+    ranks = cycle.pagerank()
+    assert ranks == pytest.approx({"A": 1 / 3, "B": 1 / 3, "C": 1 / 3})
+
+    star = Graph.from_edges([("A", "hub"), ("B", "hub"), ("C", "hub")])
+    ranks = star.pagerank(damping=0.85)
+    assert sum(ranks.values()) == pytest.approx(1.0)  # dangling mass redistributed
+    assert max(ranks, key=ranks.get) == "hub"
+
+
+def test_graph_parallel_pagerank_matches_serial():
+    graph = Graph.from_edges((i, i * 7 % 500) for i in range(500))
+    graph.add_edges((i, i + 1) for i in range(499))
+
+    serial = graph.pagerank()
+    assert graph.pagerank(workers=2) == pytest.approx(serial, abs=1e-12)
+    assert graph.pagerank(workers=2) == graph.pagerank(workers=2)  # deterministic
+
+
+def test_graph_parallel_hop_counts():
+    graph = Graph.from_edges([("A", "B"), ("B", "C"), ("C", "D")])
+    expected = {"A": {"A": 0, "B": 1, "C": 2, "D": 3}, "C": {"C": 0, "D": 1}}
+    assert graph.hop_counts(["A", "C"]) == expected
+    assert graph.hop_counts(["A", "C"], workers=2) == expected
+
+
+# Serialization Tests
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_graph_dump_load_round_trip(tmp_path, use_mmap):
+    path = tmp_path / "graph.bin"
+    graph = Graph.from_edges([("A", "B"), ("B", "C"), ("C", "A")])
+    graph.add_vertex("D")
+    graph.dump(path)
+
+    loaded = Graph.load(path, mmap=use_mmap)
+    assert list(loaded) == ["A", "B", "C", "D"]
+    assert list(loaded.edges()) == list(graph.edges())
+    assert list(loaded["A"]) == ["B"]
+    assert list(loaded.bfs("A")) == ["A", "B", "C"]
+
+
+def test_graph_mmap_load_is_frozen(tmp_path):
+    path = tmp_path / "graph.bin"
+    Graph.from_edges([("A", "B")]).dump(path)
+
+    loaded = Graph.load(path, mmap=True)  # a frozen CSR view over the file
+    with pytest.raises(TypeError):
+        loaded["C"] = ["A"]
+    assert loaded.thaw() == Graph.from_edges([("A", "B")])
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_graph_load_rejects_foreign_file(tmp_path, use_mmap):
+    path = tmp_path / "tree.bin"
+    BinarySearchTree.from_iterable([1, 2, 3]).dump(path)
+    with pytest.raises(ValueError):
+        Graph.load(path, mmap=use_mmap)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_graph_load_rejects_damaged_file(tmp_path, use_mmap):
+    path = tmp_path / "graph.bin"
+    Graph.from_edges((i, i + 1) for i in range(1_000)).dump(path)
+    data = path.read_bytes()
+
+    path.write_bytes(data[: len(data) // 2])  # truncated
+    with pytest.raises(ValueError):
+        Graph.load(path, mmap=use_mmap)
+
+    path.write_bytes(b"\xff" * len(data))  # corrupt header
+    with pytest.raises(ValueError):
+        Graph.load(path, mmap=use_mmap)
+
+
+# Batch Query Tests
+def test_graph_neighbors_many(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)  # force the pure-Python path
+    graph = Graph.from_edges([("A", "B"), ("A", "C"), ("B", "C")])
+    result = graph.neighbors_many(["A", "C", "B"])
+    assert [list(neighbours) for neighbours in result] == [["B", "C"], [], ["C"]]
+    with pytest.raises(KeyError):
+        graph.neighbors_many(["Z"])
+
+
+def test_graph_neighbors_many_numpy():
+    np = pytest.importorskip("numpy")
+    graph = Graph.from_edges([(0, 1), (0, 2), (1, 2)])
+    result = graph.neighbors_many(np.array([0, 2, 1]))
+    assert all(isinstance(neighbours, np.ndarray) for neighbours in result)
+    assert [neighbours.tolist() for neighbours in result] == [[1, 2], [], [2]]
@@ -1,5 +1,12 @@
 import pytest
-from nebula.data_structures import HashMap
+import sys
+import threading
+from nebula.data_structures import (
+    ConcurrentHashMap,
+    Graph,
+    HashMap,
+    PersistentHashMap,
+)
 from typing import Any
 
 
@@ -46,3 +53,369 @@ def test_hashmap_large_scale(benchmark):
         return HashMap.from_dict({str(i): i for i in range(10_000)})
 
     benchmark(build_large_map)
+
+
+# Open Addressing Tests
+class CollidingKey:
+    """Key whose hash always collides, to exercise probing"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+
+def test_hashmap_delete_preserves_order():
+    hmap = HashMap.from_dict({"a": 1, "b": 2, "c": 3})
+    del hmap["b"]  # tests __delitem__
+    assert list(hmap) == ["a", "c"]
+    assert "b" not in hmap
+    with pytest.raises(KeyError):
+        hmap["b"]
+
+    hmap["b"] = 4  # re-inserted keys go to the end
+    assert list(hmap.items()) == [("a", 1), ("c", 3), ("b", 4)]
+
+
+def test_hashmap_overwrite_keeps_position():
+    hmap = HashMap.from_dict({"a": 1, "b": 2})
+    hmap["a"] = 10
+    assert list(hmap.items()) == [("a", 10), ("b", 2)]
+    assert len(hmap) == 2
+
+
+def test_hashmap_collisions():
+    keys = [CollidingKey(str(i)) for i in range(50)]
+    hmap = HashMap()
+    for i, key in enumerate(keys):
+        hmap[key] = i
+    for key in keys[::2]:
+        del hmap[key]  # leaves tombstones in the probe chain
+
+    assert len(hmap) == 25
+    assert all(hmap[key] == i for i, key in enumerate(keys) if i % 2)
+    assert list(hmap) == keys[1::2]
+
+
+def test_hashmap_growth_and_churn():
+    hmap = HashMap()
+    for i in range(10_000):
+        hmap[i] = i
+        if i % 3 == 0:
+            del hmap[i]
+
+    expected = {i: i for i in range(10_000) if i % 3}
+    assert len(hmap) == len(expected)
+    assert dict(hmap) == expected
+    assert list(hmap) == list(expected)
+
+
+@pytest.mark.benchmark
+def test_hashmap_lookup_performance(benchmark):
+    hmap = HashMap.from_dict({str(i): i for i in range(10_000)})
+    keys = [str(i) for i in range(10_000)]
+
+    def lookup_all():
+        return sum(hmap[key] for key in keys)
+
+    assert benchmark(lookup_all) == sum(range(10_000))
+
+
+# Incremental Resize Tests
+def start_migration(hmap):
+    """Insert keys 0, 1, 2, ... until a migration begins; return how many"""
+    count = 0
+    while not hmap.resizing:
+        hmap[count] = count
+        count += 1
+    return count
+
+
+def test_hashmap_incremental_resize_lookups():
+    hmap = HashMap(max_resize_step=1)  # migrate one bucket per operation
+    count = start_migration(hmap)
+
+    assert hmap.buckets_remaining > 0  # the stat behind resizing
+    assert all(hmap[i] == i for i in range(count))  # both tables consulted
+    assert len(hmap) == count
+    assert list(hmap) == list(range(count))
+
+
+def test_hashmap_incremental_resize_step_bound():
+    """Every get/set/delete migrates at least 1 and at most max_resize_step buckets"""
+    hmap = HashMap(max_resize_step=4)
+    count = start_migration(hmap)
+    start_remaining = hmap.buckets_remaining
+    deleted = []
+
+    for step in range(start_remaining):  # at least one bucket per operation
+        if not hmap.resizing:
+            break
+        before = hmap.buckets_remaining
+        key = step % (count // 2)  # gets and overwrites cycle over live keys
+        if step % 3 == 0:
+            hmap.get(key)
+        elif step % 3 == 1 or len(deleted) == count // 2:
+            hmap[key] = -key  # overwrite, no new entry
+        else:
+            deleted.append(count - 1 - len(deleted))  # deletes take the top half
+            del hmap[deleted[-1]]
+        assert 1 <= before - hmap.buckets_remaining <= 4
+
+    assert not hmap.resizing
+    assert hmap.buckets_remaining == 0
+    assert len(hmap) == count - len(deleted)
+    assert all(hmap[key] in (key, -key) for key in range(count - len(deleted)))
+    assert all(key not in hmap for key in deleted)
+
+
+def test_hashmap_threshold_crossed_during_migration():
+    """
+    Inserts stay within max_resize_step too, even when one crosses the next load
+    threshold while a migration is still running: the new migration may only
+    start once the running one has drained, so there are never more than two
+    tables and no operation pays for a whole table
+    """
+    hmap = HashMap(max_resize_step=1)
+    for i in range(10_000):
+        before = hmap.buckets_remaining
+        hmap[i] = i
+        after = hmap.buckets_remaining
+        if after > before:  # a new migration started during this insert
+            assert before <= 1  # only this insert's step was left of the old one
+        else:
+            assert before - after <= 1
+        assert hmap.table_count <= 2
+
+    assert len(hmap) == 10_000
+    assert all(hmap[i] == i for i in range(10_000))
+
+
+def test_hashmap_default_resize_is_immediate():
+    hmap = HashMap()
+    for i in range(1_000):
+        hmap[i] = i
+        assert not hmap.resizing
+        assert hmap.buckets_remaining == 0
+        assert hmap.table_count == 1
+
+
+# Bulk Construction Tests
+def test_hashmap_from_items():
+    hmap = HashMap.from_items([("a", 1), ("b", 2), ("a", 3)])
+    assert list(hmap.items()) == [("a", 3), ("b", 2)]  # last value wins
+
+
+def test_hashmap_update():
+    hmap = HashMap.from_dict({"a": 1, "b": 2})
+    hmap.update({"b": 20, "c": 3})  # mappings
+    hmap.update([("d", 4)])  # iterables of pairs
+    assert dict(hmap) == {"a": 1, "b": 20, "c": 3, "d": 4}
+    assert list(hmap) == ["a", "b", "c", "d"]
+
+
+def test_hashmap_bulk_paths_never_rehash():
+    """resize_count counts rehashes of existing entries into a larger table"""
+    source = {i: i for i in range(100_000)}
+
+    assert HashMap.from_dict(source).resize_count == 0  # presized from len()
+    assert HashMap.from_items(source.items()).resize_count == 0
+
+    empty = HashMap()
+    empty.update(source)  # nothing to rehash, the table is allocated once
+    assert empty.resize_count == 0
+
+    merged = HashMap.from_dict(source) + HashMap.from_dict({-1: -1, -2: -2})
+    assert merged.resize_count == 0  # left table copied presized for both
+    assert len(merged) == 100_002
+
+
+def test_hashmap_update_grows_once():
+    hmap = HashMap.from_dict({"a": 1})
+    hmap.update({i: i for i in range(100_000)})
+    assert hmap.resize_count == 1  # straight to the final size
+    assert len(hmap) == 100_001
+
+
+def test_hashmap_single_inserts_count_resizes():
+    hmap = HashMap()
+    for i in range(100_000):
+        hmap[i] = i
+    assert hmap.resize_count > 0
+
+
+def test_hashmap_add_right_operand_wins():
+    h1 = HashMap.from_dict({"a": 1, "b": 2})
+    h2 = HashMap.from_dict({"b": 3, "c": 4})
+    h3 = h1 + h2
+    assert list(h3.items()) == [("a", 1), ("b", 3), ("c", 4)]
+    assert dict(h1) == {"a": 1, "b": 2}  # operands are left unchanged
+    assert dict(h2) == {"b": 3, "c": 4}
+
+
+@pytest.mark.benchmark
+def test_hashmap_merge_performance(benchmark):
+    h1 = HashMap.from_dict({str(i): i for i in range(100_000)})
+    h2 = HashMap.from_dict({str(-i): i for i in range(1_000)})
+
+    merged = benchmark(lambda: h1 + h2)
+    assert len(merged) == 100_999
+
+
+# Persistent Map Tests
+def test_persistent_hashmap_set_returns_new_version():
+    v1 = PersistentHashMap.from_dict({"a": 1, "b": 2})
+    v2 = v1.set("c", 3)
+    v3 = v2.set("a", 10)
+
+    assert dict(v1) == {"a": 1, "b": 2}  # every version stays valid
+    assert dict(v2) == {"a": 1, "b": 2, "c": 3}
+    assert dict(v3) == {"a": 10, "b": 2, "c": 3}
+    assert v3["a"] == 10 and v1["a"] == 1
+    with pytest.raises(TypeError):
+        v1["d"] = 4  # no in-place mutation
+
+
+def test_persistent_hashmap_delete_and_add():
+    v1 = PersistentHashMap.from_dict({str(i): i for i in range(1_000)})
+    v2 = v1.delete("500")
+    assert "500" in v1 and "500" not in v2
+    assert len(v1) == 1_000 and len(v2) == 999
+    with pytest.raises(KeyError):
+        v2.delete("500")
+
+    merged = v2 + PersistentHashMap.from_dict({"500": -1})
+    assert merged["500"] == -1
+    assert len(merged) == 1_000
+
+
+def test_persistent_hashmap_collisions():
+    keys = [CollidingKey(str(i)) for i in range(20)]
+    hmap = PersistentHashMap()
+    for i, key in enumerate(keys):
+        hmap = hmap.set(key, i)
+    assert all(hmap[key] == i for i, key in enumerate(keys))
+    assert len(hmap.delete(keys[0])) == 19
+
+
+@pytest.mark.benchmark
+def test_persistent_hashmap_snapshot_performance(benchmark):
+    base = PersistentHashMap.from_dict({str(i): i for i in range(100_000)})
+
+    def snapshot_per_request():
+        return [base.set("request", i) for i in range(1_000)]
+
+    versions = benchmark(snapshot_per_request)
+    assert versions[-1]["request"] == 999
+    assert "request" not in base
+
+
+# Serialization Tests
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_hashmap_dump_load_round_trip(tmp_path, use_mmap):
+    path = tmp_path / "map.bin"
+    source = {str(i): i for i in range(1_000)}
+    del source["500"]
+    HashMap.from_dict(source).dump(path)
+
+    loaded = HashMap.load(path, mmap=use_mmap)
+    assert len(loaded) == 999
+    assert list(loaded.items()) == list(source.items())  # order survives
+    assert loaded["999"] == 999
+    assert "500" not in loaded
+
+
+def test_hashmap_mmap_load_is_read_only(tmp_path):
+    path = tmp_path / "map.bin"
+    HashMap.from_dict({"a": 1}).dump(path)
+
+    loaded = HashMap.load(path, mmap=True)
+    with pytest.raises(TypeError):
+        loaded["b"] = 2
+
+    writable = HashMap.load(path, mmap=False)  # an ordinary mutable copy
+    writable["b"] = 2
+    assert dict(writable) == {"a": 1, "b": 2}
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_hashmap_load_rejects_foreign_file(tmp_path, use_mmap):
+    path = tmp_path / "graph.bin"
+    Graph.from_edges([("A", "B")]).dump(path)
+    with pytest.raises(ValueError):
+        HashMap.load(path, mmap=use_mmap)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_hashmap_load_rejects_damaged_file(tmp_path, use_mmap):
+    path = tmp_path / "map.bin"
+    HashMap.from_dict({str(i): i for i in range(1_000)}).dump(path)
+    data = path.read_bytes()
+
+    path.write_bytes(data[: len(data) // 2])  # truncated
+    with pytest.raises(ValueError):
+        HashMap.load(path, mmap=use_mmap)
+
+    path.write_bytes(b"\xff" * len(data))  # corrupt header
+    with pytest.raises(ValueError):
+        HashMap.load(path, mmap=use_mmap)
+
+
+def test_hashmap_dump_rejects_unencodable_keys(tmp_path):
+    path = tmp_path / "map.bin"
+    hmap = HashMap()
+    hmap[CollidingKey("a")] = 1  # arbitrary objects have no binary encoding
+    with pytest.raises(TypeError):
+        hmap.dump(path)
+    assert not path.exists()  # nothing half-written is left behind
+
+
+# Batch Query Tests
+def test_hashmap_get_many(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)  # force the pure-Python path
+    hmap = HashMap.from_dict({"a": 1, "b": 2})
+    assert hmap.get_many(["b", "z", "a"]) == [2, None, 1]
+    assert hmap.get_many(["z"], default=0) == [0]
+
+
+def test_hashmap_get_many_numpy():
+    np = pytest.importorskip("numpy")
+    hmap = HashMap.from_dict({i: i * i for i in range(100)})
+    result = hmap.get_many(np.arange(0, 100, 10))
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [i * i for i in range(0, 100, 10)]
+
+
+# Concurrent Map Tests
+def test_concurrent_hashmap_api():
+    hmap = ConcurrentHashMap.from_dict({"a": 1, "b": 2}, segments=4)
+    hmap["c"] = 3
+    del hmap["a"]
+    assert dict(hmap) == {"b": 2, "c": 3}
+    assert len(hmap) == 2
+    assert "b" in hmap
+
+
+def test_concurrent_hashmap_parallel_writers():
+    hmap = ConcurrentHashMap(segments=8)
+
+    def write_range(start):
+        for i in range(start, start + 1_000):
+            hmap[i] = i
+            hmap.compute("total", lambda _, total: (total or 0) + 1)  # atomic
+
+    threads = [
+        threading.Thread(target=write_range, args=(n * 1_000,)) for n in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(hmap) == 8_001
+    assert hmap["total"] == 8_000
+    assert all(hmap[i] == i for i in range(8_000))
@@ -1,5 +1,10 @@
 import pytest
-from nebula.data_structures import Heap
+import queue
+import sys
+import threading
+import time
+from itertools import count, islice
+from nebula.data_structures import BlockingHeap, Heap
 from typing import Any
 
 
@@ -45,3 +50,171 @@ def test_heap_large_scale(benchmark):
     def heapify_large():
         return Heap.from_iterable(range(10_000))
     benchmark(heapify_large)
+
+
+# Array Heap Tests
+def test_heap_pushpop_and_replace():
+    heap = Heap.from_iterable([3, 5, 7])
+    assert heap.pushpop(1) == 1  # smaller than the root, heap untouched
+    assert heap.pushpop(4) == 3
+    assert list(heap) == [4, 5, 7]
+
+    assert heap.replace(9) == 4  # pops first, then pushes
+    assert list(heap) == [5, 7, 9]
+    with pytest.raises(IndexError):
+        Heap().replace(1)
+
+
+def test_heap_nsmallest():
+    heap = Heap.from_iterable([9, 2, 7, 4, 1, 8])
+    assert heap.nsmallest(3) == [1, 2, 4]
+    assert heap.nsmallest(10) == [1, 2, 4, 7, 8, 9]
+    assert len(heap) == 6  # does not consume the heap
+
+
+def test_heap_merge_sorted_iterables():
+    merged = Heap.merge([1, 4, 7], iter([2, 5, 8]), range(3, 10, 3))
+    assert list(merged) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    streamed = Heap.merge(count(0, 2), count(1, 2))  # only a lazy merge returns
+    assert list(islice(streamed, 6)) == [0, 1, 2, 3, 4, 5]
+
+
+def test_heap_iteration_is_lazy_and_non_destructive():
+    heap = Heap.from_iterable([5, 3, 1, 4, 2])
+    iterator = iter(heap)
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+    assert len(heap) == 5
+    assert heap.peek() == 1
+    assert list(heap) == [1, 2, 3, 4, 5]
+
+
+def test_heap_add_keeps_operands():
+    h1 = Heap.from_iterable([5, 1, 3])
+    h2 = Heap.from_iterable([6, 2, 4])
+    h3 = h1 + h2
+    assert len(h3) == 6
+    assert list(h1) == [1, 3, 5]
+    assert list(h2) == [2, 4, 6]
+
+
+@pytest.mark.benchmark
+def test_heap_top_k_performance(benchmark):
+    heap = Heap.from_iterable(range(100_000, 0, -1))
+    assert benchmark(heap.nsmallest, 10) == list(range(1, 11))
+
+
+# Indexed Heap Tests
+def test_indexed_heap_membership_and_decrease_key():
+    heap = Heap(indexed=True)
+    for item, priority in [("a", 5), ("b", 3), ("c", 8)]:
+        heap.push(item, priority)
+
+    assert "a" in heap  # tests __contains__ via the position map
+    assert "z" not in heap
+    assert heap.peek() == "b"
+
+    heap.decrease_key("c", 1)
+    assert heap.peek() == "c"
+    with pytest.raises(ValueError):
+        heap.decrease_key("a", 9)  # would increase the priority
+    with pytest.raises(ValueError):
+        heap.push("a", 0)  # items are unique in indexed mode
+
+
+def test_indexed_heap_update_and_remove():
+    heap = Heap(indexed=True)
+    for priority, item in enumerate("abcdef"):
+        heap.push(item, priority)
+
+    heap.update("a", 10)  # either direction
+    heap.remove("c")
+    assert "c" not in heap
+    with pytest.raises(KeyError):
+        heap.remove("c")
+    assert [heap.pop() for _ in range(len(heap))] == ["b", "d", "e", "f", "a"]
+
+
+def test_indexed_heap_stable_handles():
+    heap = Heap(indexed=True)
+    handle = heap.push("x", 20)  # starts at the root
+    for priority in range(19, -1, -1):
+        heap.push(priority, priority)  # each smaller push sifts "x" away
+    for priority in range(21, 50):
+        heap.push(priority, priority)
+    assert [heap.pop() for _ in range(5)] == [0, 1, 2, 3, 4]  # moves "x" again
+
+    assert heap.peek() != "x"
+    assert handle.item == "x"
+    assert handle.priority == 20
+    heap.decrease_key(handle, -1)  # the handle still finds "x" wherever it is
+    assert handle.priority == -1
+    assert heap.pop() == "x"
+    assert heap.pop() == 5
+
+
+@pytest.mark.benchmark
+def test_indexed_heap_decrease_key_performance(benchmark):
+    def relax_all():
+        heap = Heap(indexed=True)
+        for i in range(10_000):
+            heap.push(i, 10_000 + i)
+        for i in range(10_000):
+            heap.decrease_key(i, i)
+        return heap.pop()
+
+    assert benchmark(relax_all) == 0
+
+
+# Batch Push Tests
+def test_heap_push_many(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)  # force the pure-Python path
+    heap = Heap.from_iterable([5, 1])
+    heap.push_many([4, 2, 3])  # one heapify instead of n sift-ups
+    assert len(heap) == 5
+    assert list(heap) == [1, 2, 3, 4, 5]
+
+
+def test_heap_push_many_numpy():
+    np = pytest.importorskip("numpy")
+    heap = Heap()
+    heap.push_many(np.array([3, 1, 2]))
+    assert heap.peek() == 1
+    assert list(heap) == [1, 2, 3]
+
+
+# Blocking Heap Tests
+def test_blocking_heap_put_get():
+    heap = BlockingHeap()
+    for item in [3, 1, 2]:
+        heap.put(item)
+    assert [heap.get() for _ in range(3)] == [1, 2, 3]
+    with pytest.raises(queue.Empty):
+        heap.get(timeout=0.01)
+
+
+def test_blocking_heap_wakes_waiting_consumer():
+    heap = BlockingHeap()
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(heap.get(timeout=5)))
+    consumer.start()
+
+    deadline = time.monotonic() + 5
+    while heap.waiting == 0:  # number of consumers blocked in get()
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    assert results == []
+
+    heap.put("job")  # must wake the blocked consumer
+    consumer.join(timeout=5)
+    assert not consumer.is_alive()
+    assert results == ["job"]
+    assert heap.waiting == 0
+
+
+def test_blocking_heap_bounded():
+    heap = BlockingHeap(maxsize=1)
+    heap.put(1)
+    with pytest.raises(queue.Full):
+        heap.put(2, timeout=0.01)
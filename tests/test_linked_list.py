@@ -111,15 +111,65 @@ def test_linked_list_arithmetic():
 
 
 # Performance Tests
-def test_linked_list_large_scale():
-    @pytest.mark.benchmark
-    def test_append_performance(benchmark):
-        def append_items():
-            ll = LinkedList()
-            for i in range(10_000):
-                ll.append(i)
+@pytest.mark.benchmark
+def test_linked_list_large_scale(benchmark):
+    def append_items():
+        ll = LinkedList()
+        for i in range(10_000):
+            ll.append(i)
+        return ll
 
-        benchmark(append_items)
+    ll = benchmark(append_items)
+    assert ll.size == 10_000
+    assert ll.tail.value == 9_999
+
+
+@pytest.mark.benchmark
+def test_linked_list_extend_performance(benchmark):
+    ll = benchmark(lambda: LinkedList().extend(range(100_000)))
+    assert ll.size == 100_000
+
+
+# Bulk Operation Tests
+def test_linked_list_extend():
+    ll = LinkedList([1, 2])
+    ll.extend(iter([3, 4]))
+    assert list(ll) == [1, 2, 3, 4]
+    assert ll.tail.value == 4
+    assert ll.size == 4
+
+    assert ll.extend([]) is ll  # returns self for chaining
+    assert ll.size == 4
+
+
+def test_linked_list_concat_inplace():
+    ll1 = LinkedList([1, 2])
+    ll2 = LinkedList([3, 4])
+    ll1.concat_inplace(ll2)  # splices ll2's nodes, transferring ownership
+
+    assert list(ll1) == [1, 2, 3, 4]
+    assert ll1.tail.value == 4
+    assert ll1.size == 4
+    assert ll2.head is None and ll2.tail is None and ll2.size == 0
+
+    empty = LinkedList()
+    empty.concat_inplace(ll1)
+    assert list(empty) == [1, 2, 3, 4]
+    assert empty.head.value == 1
+
+
+def test_linked_list_iadd_and_mul():
+    ll1 = LinkedList([1, 2])
+    ll2 = LinkedList([3])
+    alias = ll1
+    ll1 += ll2  # tests __iadd__
+    assert ll1 is alias
+    assert list(ll1) == [1, 2, 3]
+    assert list(ll2) == [3]  # right operand is copied, not consumed
+
+    assert list(LinkedList([1, 2]) * 3) == [1, 2, 1, 2, 1, 2]
+    assert (LinkedList([1, 2]) * 3).tail.value == 2
+    assert len(LinkedList([1]) * 0) == 0
 
 
 # Edge Cases and Complex Operations
@@ -147,3 +197,98 @@ def test_linked_list_comparison():
     assert ll1 != ll3
     assert ll1 < ll3  # tests __lt__
     assert ll3 > ll1  # tests __gt__
+
+
+# Unrolled Storage Tests
+@pytest.mark.parametrize("block_size", [1, 4, 64])
+def test_unrolled_linked_list_matches_node_storage(block_size):
+    values = list(range(100))
+    ll = LinkedList(values, storage="unrolled", block_size=block_size)
+
+    assert list(ll) == values
+    assert list(reversed(ll)) == values[::-1]
+    assert ll[0] == 0 and ll[37] == 37 and ll[-1] == 99  # tests int __getitem__
+    assert list(ll[30:70:3]) == values[30:70:3]
+    assert list(ll[::-7]) == values[::-7]
+    with pytest.raises(IndexError):
+        ll[100]
+
+
+def test_unrolled_linked_list_mutation():
+    ll = LinkedList(range(10), storage="unrolled", block_size=4)
+    for value in (1, 2, 3):  # blocks below half full are merged with a neighbour
+        ll.delete(value)
+    for value in range(10, 20):  # full blocks split when appended to
+        ll.append(value)
+
+    expected = [0, *range(4, 20)]
+    assert list(ll) == expected
+    assert list(reversed(ll)) == expected[::-1]
+    assert ll.size == 17
+    assert ll[-1] == 19
+    assert all(2 <= length <= 4 for length in ll.block_sizes)  # per-block lengths
+    assert sum(ll.block_sizes) == ll.size
+
+
+@pytest.mark.benchmark
+def test_unrolled_linked_list_reversed_performance(benchmark):
+    ll = LinkedList(range(100_000), storage="unrolled")
+    assert benchmark(lambda: sum(reversed(ll))) == sum(range(100_000))
+
+
+def test_node_storage_still_default():
+    head = Node(1)
+    head.next = Node(2)
+    ll = LinkedList.from_node(head)
+    assert ll.head is head
+    assert list(reversed(ll)) == [2, 1]
+
+
+# Slice View Tests
+def test_linked_list_slice_is_lazy_view():
+    ll = LinkedList(range(10))
+    view = ll[2:8]
+    assert not isinstance(view, LinkedList)  # no new container is built
+    assert len(view) == 6
+    assert list(view) == [2, 3, 4, 5, 6, 7]
+    assert list(view[1::2]) == [3, 5, 7]  # views slice further
+    assert list(view[::-1]) == [7, 6, 5, 4, 3, 2]
+
+    ll.delete(3)  # iterating re-reads positions 2..7 of the underlying list
+    assert list(view) == [2, 4, 5, 6, 7, 8]
+    assert len(view) == 6
+
+
+def test_linked_list_slice_copy_is_snapshot():
+    ll = LinkedList(range(5))
+    snapshot = ll[1:4].copy()
+    ll.delete(2)
+
+    assert isinstance(snapshot, LinkedList)
+    assert list(snapshot) == [1, 2, 3]
+    assert snapshot.size == 3
+
+
+@pytest.mark.benchmark
+def test_linked_list_window_performance(benchmark):
+    ll = LinkedList(range(1_000_000))
+    assert benchmark(lambda: list(ll[999_990:])) == list(range(999_990, 1_000_000))
+
+
+# Node Memory Tests
+def test_node_uses_slots():
+    node = Node(1)
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.extra = "no per-instance dict"
+
+
+def test_linked_list_node_pool_reuses_nodes():
+    ll = LinkedList([1, 2, 3], pooled=True)
+    freed = ll.head.next
+    ll.delete(2)
+    ll.append(4)  # the freed node is taken from the pool
+
+    assert ll.tail is freed
+    assert list(ll) == [1, 3, 4]
+    assert ll.size == 3
@@ -1,8 +1,17 @@
 import random
+import sys
+from itertools import islice
+from types import GeneratorType
 
 import pytest
 
-from nebula.data_structures import AbstractTree, BinarySearchTree, BinaryTree
+from nebula.data_structures import (
+    AbstractTree,
+    BinarySearchTree,
+    BinaryTree,
+    HashMap,
+    PersistentBinarySearchTree,
+)
 
 # Core Tree Behavior Tests
 # ----------------------
@@ -137,12 +146,12 @@ def test_bst_add_operator():
     expected_values = [3, 4, 5, 6, 7, 8]
     assert list(merged_bst.inorder()) == expected_values
 
-    # Verify the merged BST maintains BST properties
-    assert (
-        merged_bst.root.value == 5
-    )  # Root should be the first inserted value from bst1
-    assert merged_bst.root.left.value == 4
+    # Verify the merged BST is rebuilt balanced from the merged inorder stream
+    assert merged_bst.root.value == 5  # Lower median of [3, 4, 5, 6, 7, 8]
+    assert merged_bst.root.left.value == 3
+    assert merged_bst.root.left.right.value == 4
     assert merged_bst.root.right.value == 7
+    assert BinarySearchTree.is_balanced(merged_bst)
 
     # Verify that the original BSTs remain unchanged
     assert list(bst1.inorder()) == [3, 5, 7]
@@ -370,3 +379,432 @@ def test_binary_tree_insert_maintains_complete_property():
     # Verify it's filling left-to-right at each level
     last_level_nodes = list(tree.level_order())[-2:]  # Last two nodes
     assert last_level_nodes == [4, 5]
+
+
+# Array Storage Tests
+# -----------------
+# The implicit-array storage mode must be indistinguishable from the
+# node-based default through the public root/left/right view
+
+
+def test_array_storage_matches_node_storage(array_binary_tree, complete_binary_tree):
+    """
+    Verify array storage fills the same complete shape as the default
+         1
+       /   \\
+      2     3
+     / \\   / \\
+    4   5 6   7
+    """
+    node_tree = complete_binary_tree  # built by level-order insert(), like the array
+
+    assert array_binary_tree.root.value == 1
+    assert array_binary_tree.root.left.value == 2
+    assert array_binary_tree.root.right.value == 3
+    assert array_binary_tree.root.left.left.value == 4
+    assert array_binary_tree.root.right.right.value == 7
+    assert array_binary_tree.root.left.left.left is None
+
+    assert list(array_binary_tree.level_order()) == list(node_tree.level_order())
+    assert list(array_binary_tree.preorder()) == list(node_tree.preorder())
+    assert array_binary_tree.height() == 3
+    assert len(array_binary_tree) == 7
+
+
+def test_array_storage_empty_tree():
+    tree = BinaryTree(storage="array")
+    assert tree.root is None
+    assert len(tree) == 0
+    assert list(tree.level_order()) == []
+
+
+@pytest.mark.benchmark
+def test_array_storage_insert_performance(benchmark):
+    def fill_array_tree():
+        tree = BinaryTree(storage="array")
+        for i in range(10_000):
+            tree.insert(i)
+        return tree
+
+    tree = benchmark(fill_array_tree)
+    assert len(tree) == 10_000
+
+
+# Bulk Construction Tests
+# ---------------------
+# Balanced from_iterable/from_binary_tree/__add__ build the tree directly
+# from sorted values instead of inserting one value at a time
+
+
+def test_bst_bulk_build_from_sorted_input():
+    """Already-sorted input is detected and built without re-sorting"""
+    bst = BinarySearchTree.from_iterable(range(1023))
+    assert list(bst.inorder()) == list(range(1023))
+    assert bst.height() == 10  # Perfect tree, no rotations needed
+    assert BinarySearchTree.is_balanced(bst)
+
+
+def test_bst_bulk_build_from_unsorted_input():
+    values = random.sample(range(5000), 1000)
+    bst = BinarySearchTree.from_iterable(values)
+    assert list(bst.inorder()) == sorted(values)
+    assert bst.height() == 10  # ceil(log2(1000 + 1))
+    assert BinarySearchTree.is_balanced(bst)
+
+
+def test_bst_add_merges_overlapping_trees():
+    bst1 = BinarySearchTree.from_iterable([1, 3, 5, 7])
+    bst2 = BinarySearchTree.from_iterable([2, 3, 6, 7])
+
+    merged_bst = bst1 + bst2
+
+    assert list(merged_bst.inorder()) == [1, 2, 3, 5, 6, 7]
+    assert BinarySearchTree.is_balanced(merged_bst)
+    assert list(bst1.inorder()) == [1, 3, 5, 7]
+    assert list(bst2.inorder()) == [2, 3, 6, 7]
+
+
+@pytest.mark.benchmark
+def test_tree_bulk_build_sorted_performance(benchmark):
+    values = list(range(100_000))
+
+    tree = benchmark(BinarySearchTree.from_iterable, values)
+    assert len(tree) == 100_000
+
+
+# Order Statistic Tests
+# -------------------
+# Subtree sizes kept on each node answer positional queries in O(log n)
+
+
+def test_bst_indexing(balanced_bst):
+    assert balanced_bst[0] == 1
+    assert balanced_bst[3] == 4
+    assert balanced_bst[-1] == 7  # tests negative __getitem__
+    with pytest.raises(IndexError):
+        balanced_bst[7]
+
+
+def test_bst_slicing_by_rank(balanced_bst):
+    assert list(balanced_bst[2:5]) == [3, 4, 5]
+    assert list(balanced_bst[::3]) == [1, 4, 7]
+    assert list(balanced_bst[5:100]) == [6, 7]
+
+
+def test_bst_rank_and_count_range(balanced_bst):
+    assert balanced_bst.rank(1) == 0  # number of keys strictly less than value
+    assert balanced_bst.rank(4) == 3
+    assert balanced_bst.rank(100) == 7
+    assert balanced_bst.count_range(2, 6) == 4  # lo <= key < hi
+    assert balanced_bst.count_range(6, 2) == 0
+
+
+def test_bst_order_statistics_survive_rotations():
+    bst = BinarySearchTree()
+    for i in range(100):  # Ascending inserts force repeated rotations
+        bst.insert(i)
+    bst.delete(50)
+
+    assert len(bst) == 99
+    assert bst[50] == 51
+    assert bst.rank(51) == 50
+    assert [bst[i] for i in range(len(bst))] == list(bst.inorder())
+
+
+@pytest.mark.benchmark
+def test_bst_indexing_performance(benchmark):
+    tree = BinarySearchTree.from_iterable(range(100_000))
+
+    def page_through():
+        return [list(tree[i : i + 10]) for i in range(0, 100_000, 1_000)]
+
+    pages = benchmark(page_through)
+    assert pages[1] == list(range(1_000, 1_010))
+
+
+# Iterative Traversal Tests
+# -----------------------
+# Traversals are lazy generators driven by an explicit stack or deque,
+# so tree depth is never limited by the recursion limit
+
+
+def test_traversals_are_generators(sample_tree, sample_bst):
+    for tree in (sample_tree, sample_bst):
+        assert isinstance(tree.inorder(), GeneratorType)
+        assert isinstance(tree.preorder(), GeneratorType)
+        assert isinstance(tree.postorder(), GeneratorType)
+        assert isinstance(tree.level_order(), GeneratorType)
+        assert isinstance(tree.nodes(), GeneratorType)
+
+
+def test_traversals_on_degenerate_tree():
+    """A fully skewed BST deeper than the recursion limit must still traverse"""
+    depth = sys.getrecursionlimit() * 2
+    bst = BinarySearchTree(auto_balance=False)
+    for i in range(depth):
+        bst.insert(i)
+
+    assert list(bst.inorder()) == list(range(depth))
+    assert list(bst.preorder()) == list(range(depth))
+    assert list(bst.postorder()) == list(range(depth - 1, -1, -1))
+    assert sum(1 for _ in bst.nodes()) == depth
+
+
+def test_bst_range_bounded_inorder(balanced_bst):
+    assert list(balanced_bst.inorder(start=3, stop=6)) == [3, 4, 5]  # [start, stop)
+    assert list(balanced_bst.inorder(start=5)) == [5, 6, 7]
+    assert list(balanced_bst.inorder(stop=3)) == [1, 2]
+    assert list(balanced_bst.inorder(start=2.5, stop=4.5)) == [3, 4]
+
+
+def test_bst_reversed_inorder(balanced_bst):
+    assert list(reversed(balanced_bst)) == [7, 6, 5, 4, 3, 2, 1]  # tests __reversed__
+    assert list(islice(reversed(balanced_bst), 3)) == [7, 6, 5]  # top-k
+
+
+# Cached Height Tests
+# -----------------
+# Heights are stored on nodes and kept current through insert, delete and
+# rotation, so height() and balance_factor() read a field instead of recursing
+
+
+def test_bst_cached_heights_follow_mutation():
+    bst = BinarySearchTree()
+    for i in range(15):
+        bst.insert(i)
+    assert bst.height() == 4
+    assert all(-1 <= node.balance_factor() <= 1 for node in bst.nodes())
+
+    for i in range(4, 15):
+        bst.delete(i)
+    assert bst.height() == 3  # Only possible AVL height for 4 keys
+    assert all(-1 <= node.balance_factor() <= 1 for node in bst.nodes())
+
+
+def test_binary_tree_heights_rebuilt_after_insert(complete_binary_tree):
+    assert complete_binary_tree.height() == 3
+    complete_binary_tree.insert(8)  # Starts a fourth level under 4
+    assert complete_binary_tree.height() == 4
+    assert complete_binary_tree.root.left.height() == 3
+    assert complete_binary_tree.root.right.height() == 2
+    assert BinarySearchTree.is_balanced(complete_binary_tree)
+
+
+def test_is_balanced_on_degenerate_tree():
+    """is_balanced is a single post-order pass, not recursion per node"""
+    bst = BinarySearchTree(auto_balance=False)
+    for i in range(sys.getrecursionlimit() * 2):
+        bst.insert(i)
+    assert not BinarySearchTree.is_balanced(bst)
+
+
+@pytest.mark.benchmark
+def test_is_balanced_performance(benchmark):
+    tree = BinarySearchTree.from_iterable(range(100_000))
+    assert benchmark(BinarySearchTree.is_balanced, tree)
+
+
+# Slice View Tests
+# --------------
+# Slicing returns a lazy view over the tree; .copy() takes a snapshot
+
+
+def test_tree_slice_is_lazy_view(balanced_bst):
+    view = balanced_bst[1:6]
+    assert not isinstance(view, AbstractTree)
+    assert len(view) == 5
+    assert list(view) == [2, 3, 4, 5, 6]
+    assert list(view[::2]) == [2, 4, 6]
+
+    snapshot = view.copy()
+    balanced_bst.insert(0)  # the view re-reads ranks 1..5 of the updated tree
+    assert list(view) == [1, 2, 3, 4, 5]
+    assert isinstance(snapshot, BinarySearchTree)
+    assert list(snapshot.inorder()) == [2, 3, 4, 5, 6]
+
+
+# Node Memory Tests
+# ---------------
+# Nodes are __slots__ objects, optionally recycled through a free list
+
+
+def test_tree_nodes_use_slots(sample_tree, sample_bst):
+    for tree in (sample_tree, sample_bst):
+        assert not hasattr(tree.root, "__dict__")
+
+
+def test_bst_node_pool_reuses_nodes():
+    bst = BinarySearchTree.from_iterable([4, 2, 6], pooled=True)
+    freed = bst.search(6)
+    bst.delete(6)
+    bst.insert(7)
+
+    assert bst.search(7) is freed
+    assert list(bst.inorder()) == [2, 4, 7]
+    assert freed.left is None and freed.right is None
+
+
+# Persistent Tree Tests
+# -------------------
+# Every update returns a new version that shares untouched subtrees
+
+
+def test_persistent_bst_insert_returns_new_version():
+    v1 = PersistentBinarySearchTree.from_iterable([4, 2, 6, 1, 3, 5, 7])
+    v2 = v1.insert(8)
+
+    assert list(v1.inorder()) == [1, 2, 3, 4, 5, 6, 7]  # unchanged
+    assert list(v2.inorder()) == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert v2.root.left is v1.root.left  # path copying shares the other side
+    assert v2.root is not v1.root
+    assert PersistentBinarySearchTree.is_balanced(v2)
+
+
+def test_persistent_bst_delete_and_add():
+    v1 = PersistentBinarySearchTree.from_iterable(range(10))
+    v2 = v1.delete(5)
+    assert 5 in v1 and 5 not in v2
+    assert len(v1) == 10 and len(v2) == 9
+
+    merged = v2 + PersistentBinarySearchTree.from_iterable([5, 20])
+    assert list(merged.inorder()) == list(range(10)) + [20]
+    assert list(v2.inorder()) == [0, 1, 2, 3, 4, 6, 7, 8, 9]
+
+
+def test_persistent_bst_is_immutable():
+    tree = PersistentBinarySearchTree.from_iterable([1, 2, 3])
+    with pytest.raises(AttributeError):
+        tree.root.value = 10
+
+    mutable = tree.to_bst()  # explicit copy back to a mutable tree
+    assert isinstance(mutable, BinarySearchTree)
+    mutable.insert(4)
+    assert list(tree.inorder()) == [1, 2, 3]
+
+
+# Serialization Tests
+# -----------------
+# dump() writes sorted key arrays; load(mmap=True) serves queries off the map
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_bst_dump_load_round_trip(tmp_path, use_mmap):
+    path = tmp_path / "tree.bin"
+    values = random.sample(range(1_000), 500)
+    BinarySearchTree.from_iterable(values).dump(path)
+
+    loaded = BinarySearchTree.load(path, mmap=use_mmap)
+    assert len(loaded) == 500
+    assert list(loaded.inorder()) == sorted(values)
+    assert all(value in loaded for value in values)
+
+
+def test_bst_mmap_load_is_read_only(tmp_path):
+    path = tmp_path / "tree.bin"
+    BinarySearchTree.from_iterable([4, 2, 6]).dump(path)
+
+    loaded = BinarySearchTree.load(path, mmap=True)
+    assert 2 in loaded
+    assert loaded.search(5) is None
+    assert list(loaded[1:]) == [4, 6]
+    with pytest.raises(TypeError):
+        loaded.insert(5)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_bst_load_rejects_foreign_file(tmp_path, use_mmap):
+    path = tmp_path / "map.bin"
+    HashMap.from_dict({"a": 1}).dump(path)
+    with pytest.raises(ValueError):
+        BinarySearchTree.load(path, mmap=use_mmap)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_bst_load_rejects_damaged_file(tmp_path, use_mmap):
+    path = tmp_path / "tree.bin"
+    BinarySearchTree.from_iterable(range(1_000)).dump(path)
+    data = path.read_bytes()
+
+    path.write_bytes(data[: len(data) // 2])  # truncated
+    with pytest.raises(ValueError):
+        BinarySearchTree.load(path, mmap=use_mmap)
+
+    path.write_bytes(b"\xff" * len(data))  # corrupt header
+    with pytest.raises(ValueError):
+        BinarySearchTree.load(path, mmap=use_mmap)
+
+
+# Backend Tests
+# -----------
+# backend="blocks" stores keys in a sorted list of sorted blocks behind the
+# same API as the default AVL backend
+
+
+@pytest.mark.parametrize("backend", ["avl", "blocks"])
+def test_bst_backends_share_api(backend):
+    values = random.sample(range(10_000), 2_000)
+    bst = BinarySearchTree.from_iterable(values, backend=backend)
+    bst.insert(-1)
+    bst.delete(values[0])
+    expected = sorted([-1, *values[1:]])
+
+    assert len(bst) == len(expected)
+    assert list(bst.inorder()) == expected
+    assert list(bst) == expected
+    assert list(bst[10:20]) == expected[10:20]
+    assert -1 in bst
+    assert values[0] not in bst
+    assert bst.search(values[1]) is not None
+    assert bst.search(10_001) is None
+
+
+def test_bst_blocks_backend_split_and_merge():
+    bst = BinarySearchTree(backend="blocks", block_size=4)
+    for i in range(100):  # blocks split once they exceed block_size
+        bst.insert(i)
+    assert max(bst.block_sizes) <= 4  # per-block lengths, in key order
+    assert len(bst.block_sizes) >= 25
+
+    for i in range(90):  # and merge once they fall below half
+        if i % 10:
+            bst.delete(i)
+    remaining = [i for i in range(100) if i % 10 == 0 or i >= 90]
+
+    assert list(bst.inorder()) == remaining
+    assert all(2 <= length <= 4 for length in bst.block_sizes)
+    assert sum(bst.block_sizes) == len(bst)
+    assert bst[0] == 0 and bst[-1] == 99
+
+
+def test_bst_unknown_backend():
+    with pytest.raises(ValueError):
+        BinarySearchTree(backend="skiplist")
+
+
+@pytest.mark.benchmark
+def test_bst_blocks_range_scan_performance(benchmark):
+    tree = BinarySearchTree.from_iterable(range(100_000), backend="blocks")
+    scanned = benchmark(lambda: sum(tree.inorder(start=25_000, stop=75_000)))
+    assert scanned == sum(range(25_000, 75_000))
+
+
+# Batch Query Tests
+# ---------------
+# contains_many answers a whole batch from a cached sorted snapshot
+
+
+def test_bst_contains_many(balanced_bst, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)  # force the pure-Python path
+    result = balanced_bst.contains_many([0, 1, 4, 8, 7])
+    assert result == [False, True, True, False, True]
+
+    balanced_bst.insert(8)  # mutation invalidates the cached snapshot
+    assert list(balanced_bst.contains_many([8])) == [True]
+
+
+def test_bst_contains_many_numpy(balanced_bst):
+    np = pytest.importorskip("numpy")
+    result = balanced_bst.contains_many(np.arange(10))
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == bool
+    assert result.tolist() == [False] + [True] * 7 + [False] * 2